@@ -15,7 +15,7 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-from download_audio_from_yt import download_audio
+from download_audio_from_yt import download_audios
 
 REPO_ROOT = Path(__file__).resolve().parent
 DEFAULT_REMOTE_HOST = "10.0.0.181"
@@ -104,21 +104,28 @@ def upload_mp3s(local_dir: Path, host: str, user: str, remote_dir: str) -> None:
         "--progress",
         "--include=*.mp3",
         "--include=*.MP3",
+        "--include=*.m4a",
+        "--include=*.M4A",
         "--exclude=*",
         f"{local_dir}/",
         dest,
     ]
-    print(f"\nUploading MP3s to {dest}")
+    print(f"\nUploading audio files to {dest}")
     subprocess.run(cmd, check=True)
 
 
 def download_all(tracks: list[Track], output_dir: Path) -> list[str]:
     downloaded: list[str] = []
-    for i, track in enumerate(tracks, 1):
-        print(f"\n[{i}/{len(tracks)}] {track.category} — {track.title}")
-        print(f"  {track.url}")
+    # Tracks are downloaded concurrently, one batch per playlist setting.
+    for playlist in (False, True):
+        batch = [t for t in tracks if t.playlist == playlist]
+        if not batch:
+            continue
+        for i, track in enumerate(batch, 1):
+            print(f"[{i}/{len(batch)}] {track.category} — {track.title}")
+            print(f"  {track.url}")
         try:
-            files = download_audio(track.url, str(output_dir), playlist=track.playlist)
+            files = download_audios([t.url for t in batch], str(output_dir), playlist=playlist)
             downloaded.extend(files)
         except Exception as exc:
             print(f"  FAILED: {exc}", file=sys.stderr)
@@ -6,54 +6,100 @@
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import yt_dlp
 
+DEFAULT_MAX_WORKERS = 4
+AUDIO_EXTENSIONS = (".mp3", ".m4a")
+
 
 def _ydl_opts(output_dir: str, playlist: bool) -> dict:
     return {
-        "format": "bestaudio/best",
+        # Prefer YouTube's native AAC/m4a stream: FFmpegExtractAudio then just
+        # copies the audio track instead of re-encoding it. Other sources
+        # (e.g. opus-only) are still converted to m4a.
+        "format": "bestaudio[ext=m4a]/bestaudio/best",
         "outtmpl": f"{output_dir}/%(title)s.%(ext)s",
         "postprocessors": [
             {
                 "key": "FFmpegExtractAudio",
-                "preferredcodec": "mp3",
-                "preferredquality": "192",
+                "preferredcodec": "m4a",
             }
         ],
         "noplaylist": not playlist,
+        "concurrent_fragment_downloads": 4,
+        # Let ffmpeg use every core when extracting audio.
+        "postprocessor_args": {"extractaudio": ["-threads", str(os.cpu_count() or 1)]},
         "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "extractor_args": {"youtube": {"player_client": ["android", "web"]}},
     }
 
 
+def _list_audio_files(output_dir: str) -> set[str]:
+    return {f for f in os.listdir(output_dir) if f.lower().endswith(AUDIO_EXTENSIONS)}
+
+
+def _download_one(url: str, output_dir: str, playlist: bool) -> None:
+    # YoutubeDL instances are not thread-safe: use one per download.
+    with yt_dlp.YoutubeDL(_ydl_opts(output_dir, playlist)) as ydl:
+        ydl.download([url])
+
+
 def download_audio(url: str, output_dir: str = "mp3", *, playlist: bool = False) -> list[str]:
-    """Download audio from a YouTube URL as MP3. Returns paths to new files."""
+    """Download audio from a YouTube URL as m4a. Returns paths to new files."""
+    return download_audios([url], output_dir, playlist=playlist)
+
+
+def download_audios(
+    urls: list[str],
+    output_dir: str = "mp3",
+    *,
+    playlist: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> list[str]:
+    """Download audio from several YouTube URLs concurrently as m4a.
+
+    Downloads (and their ffmpeg extraction) overlap across a thread pool, so
+    one URL's audio extraction no longer leaves the network idle. Raises the
+    first error if every URL failed; otherwise failures are reported and
+    skipped. Returns paths to new files.
+    """
     os.makedirs(output_dir, exist_ok=True)
-    before = {f for f in os.listdir(output_dir) if f.lower().endswith(".mp3")}
+    before = _list_audio_files(output_dir)
 
-    ydl_opts = _ydl_opts(output_dir, playlist)
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        print(f"Downloading to '{output_dir}'...")
-        ydl.download([url])
+    print(f"Downloading {len(urls)} URL(s) to '{output_dir}'...")
+    errors: list[Exception] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as pool:
+        futures = {pool.submit(_download_one, url, output_dir, playlist): url for url in urls}
+        for future, url in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Failed to download {url}: {e}", file=sys.stderr)
+                errors.append(e)
+    if errors and len(errors) == len(urls):
+        raise errors[0]
 
-    after = {f for f in os.listdir(output_dir) if f.lower().endswith(".mp3")}
-    new_files = sorted(after - before)
+    new_files = sorted(_list_audio_files(output_dir) - before)
     if new_files:
         print(f"Downloaded {len(new_files)} file(s).")
     else:
-        print("No new MP3 files were created.")
+        print("No new audio files were created.")
     return [os.path.join(output_dir, f) for f in new_files]
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: uv run download_audio_from_yt.py <YOUTUBE_URL> [output_dir]")
+    args = sys.argv[1:]
+    if not args:
+        print("Usage: uv run download_audio_from_yt.py <YOUTUBE_URL> [<YOUTUBE_URL> ...] [output_dir]")
         sys.exit(1)
 
-    video_url = sys.argv[1]
-    out_dir = sys.argv[2] if len(sys.argv) > 2 else "mp3"
+    out_dir = "mp3"
+    if len(args) > 1 and not args[-1].startswith(("http://", "https://")):
+        out_dir = args.pop()
     try:
-        download_audio(video_url, out_dir)
+        download_audios(args, out_dir)
     except Exception as e:
         print(f"An error occurred: {e}")
         sys.exit(1)
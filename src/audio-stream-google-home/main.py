@@ -1,63 +1,103 @@
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.concurrency import asynccontextmanager
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import FileResponse, Response
 import pychromecast
+from pychromecast.socket_client import CONNECTION_STATUS_CONNECTED, ConnectionStatusListener
 from pydantic import BaseModel
 import asyncio
 import functools
+import json
 import os
 import time
 import logging
 import subprocess
+import sys
 import re
 import threading
+import zlib
 from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
 import uvicorn
 from dotenv import load_dotenv
 from pathlib import Path
+from dataclasses import dataclass, replace
 try:
     from .telemetry import TelemetryService, get_telemetry_router
 except ImportError:
     from telemetry import TelemetryService, get_telemetry_router
 
-# Load the .env file explicitly from the repository root (works regardless of CWD).
-# File location: src/audio-stream-google-home/main.py -> parents[2] is the repo root.
-env_path = Path(__file__).resolve().parents[2] / ".env"
-if env_path.exists():
-    load_dotenv(dotenv_path=env_path, verbose=True)
-else:
-    # Fallback to default search behavior
-    load_dotenv(verbose=True)
-
-ENV = os.getenv("AB_ENV", "production")
-PORT_SERVER = int(os.getenv("AB_PORT_SERVER", "8801"))
-IP_SERVER = os.getenv("AB_IP_SERVER", "127.0.0.1") # IP that the Google Home will reach to download the MP3s
-
-# Determine MP3 folder: prefer `AB_MP3_FOLDER` from env; otherwise use repo-relative `mp3`.
 repo_root = Path(__file__).resolve().parents[2]
 default_mp3 = repo_root / "mp3"
-MP3_FOLDER = os.getenv("AB_MP3_FOLDER")
-if MP3_FOLDER:
-    MP3_FOLDER = MP3_FOLDER
-else:
-    MP3_FOLDER = str(default_mp3)
-
-GOOGLE_HOME_PORT = 8009
 MP3_ROUTE = "/mp3"
-CAST_CONNECT_TRIES = max(1, int(os.getenv("AB_CAST_CONNECT_TRIES", "5")))
-CAST_CONNECT_RETRY_WAIT = float(os.getenv("AB_CAST_CONNECT_RETRY_WAIT", "2"))
-CAST_CONNECT_TIMEOUT = float(os.getenv("AB_CAST_CONNECT_TIMEOUT", "5"))
-CAST_WAIT_TIMEOUT = float(os.getenv("AB_CAST_WAIT_TIMEOUT", "8"))
-CAST_CONTROLLER_TIMEOUT = float(os.getenv("AB_CAST_CONTROLLER_TIMEOUT", "8"))
-CAST_REQUEST_TIMEOUT = float(os.getenv("AB_CAST_REQUEST_TIMEOUT", "120"))
-CAST_PLAY_RETRIES = max(1, int(os.getenv("AB_CAST_PLAY_RETRIES", "3")))
-CAST_PLAY_RETRY_WAIT = float(os.getenv("AB_CAST_PLAY_RETRY_WAIT", "2"))
-CAST_WORKERS = int(os.getenv("AB_CAST_WORKERS", "2"))
-DEVICE_REFRESH_TIMEOUT = float(os.getenv("AB_DEVICE_REFRESH_TIMEOUT", "35"))
-DEVICE_DISCOVERY_RETRIES = max(1, int(os.getenv("AB_DEVICE_DISCOVERY_RETRIES", "3")))
-DEVICE_DISCOVERY_RETRY_WAIT = float(os.getenv("AB_DEVICE_DISCOVERY_RETRY_WAIT", "1.5"))
-DEVICE_DISCOVERY_AVAHI_TIMEOUT = float(os.getenv("AB_DEVICE_DISCOVERY_AVAHI_TIMEOUT", "10"))
+# Internal nginx location that streams the MP3 folder (see nginx/audio-book.conf)
+NGINX_MP3_LOCATION = "/_mp3"
+# Audio files served from the MP3 folder. m4a is kept as downloaded (no
+# transcode); Cast devices play both natively.
+AUDIO_CONTENT_TYPES = {".mp3": "audio/mpeg", ".m4a": "audio/mp4"}
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Server configuration, read once from the environment at import."""
+
+    env: str
+    port: int  # Public port the Google Home uses to reach the server
+    listen_port: int  # Port uvicorn binds; differs from `port` when behind nginx
+    ip_server: str  # IP that the Google Home will reach to download the MP3s
+    behind_nginx: bool  # Hand audio bytes to nginx via X-Accel-Redirect
+    mp3_folder: str
+    google_home_port: int
+    cast_connect_tries: int
+    cast_connect_retry_wait: float
+    cast_connect_timeout: float
+    cast_wait_timeout: float
+    cast_controller_timeout: float
+    cast_request_timeout: float
+    cast_play_retries: int
+    cast_play_retry_wait: float
+    cast_workers: int
+    device_refresh_timeout: float
+    device_discovery_retries: int
+    device_discovery_retry_wait: float
+    device_discovery_avahi_timeout: float
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        # Load the .env file explicitly from the repository root (works regardless of CWD).
+        # File location: src/audio-stream-google-home/main.py -> parents[2] is the repo root.
+        env_path = repo_root / ".env"
+        if env_path.exists():
+            load_dotenv(dotenv_path=env_path, verbose=True)
+        else:
+            # Fallback to default search behavior
+            load_dotenv(verbose=True)
+
+        return cls(
+            env=os.getenv("AB_ENV", "production"),
+            port=int(os.getenv("AB_PORT_SERVER", "8801")),
+            listen_port=int(os.getenv("AB_LISTEN_PORT") or os.getenv("AB_PORT_SERVER", "8801")),
+            ip_server=os.getenv("AB_IP_SERVER", "127.0.0.1"),
+            behind_nginx=os.getenv("AB_BEHIND_NGINX", "false").lower() in ("1", "true", "yes"),
+            # Prefer `AB_MP3_FOLDER` from env; otherwise use repo-relative `mp3`.
+            mp3_folder=os.getenv("AB_MP3_FOLDER") or str(default_mp3),
+            google_home_port=8009,
+            cast_connect_tries=max(1, int(os.getenv("AB_CAST_CONNECT_TRIES", "5"))),
+            cast_connect_retry_wait=float(os.getenv("AB_CAST_CONNECT_RETRY_WAIT", "2")),
+            cast_connect_timeout=float(os.getenv("AB_CAST_CONNECT_TIMEOUT", "5")),
+            cast_wait_timeout=float(os.getenv("AB_CAST_WAIT_TIMEOUT", "8")),
+            cast_controller_timeout=float(os.getenv("AB_CAST_CONTROLLER_TIMEOUT", "8")),
+            cast_request_timeout=float(os.getenv("AB_CAST_REQUEST_TIMEOUT", "120")),
+            cast_play_retries=max(1, int(os.getenv("AB_CAST_PLAY_RETRIES", "3"))),
+            cast_play_retry_wait=float(os.getenv("AB_CAST_PLAY_RETRY_WAIT", "2")),
+            cast_workers=int(os.getenv("AB_CAST_WORKERS", "2")),
+            device_refresh_timeout=float(os.getenv("AB_DEVICE_REFRESH_TIMEOUT", "35")),
+            device_discovery_retries=max(1, int(os.getenv("AB_DEVICE_DISCOVERY_RETRIES", "3"))),
+            device_discovery_retry_wait=float(os.getenv("AB_DEVICE_DISCOVERY_RETRY_WAIT", "1.5")),
+            device_discovery_avahi_timeout=float(os.getenv("AB_DEVICE_DISCOVERY_AVAHI_TIMEOUT", "10")),
+        )
+
+
+CFG = Config.from_env()
 
 DEFAULT_DEVICE_IPS = {
     "Jacob": "10.0.0.55",
@@ -83,7 +123,7 @@ def discover_device_ips_from_avahi():
             capture_output=True,
             text=True,
             check=False,
-            timeout=DEVICE_DISCOVERY_AVAHI_TIMEOUT,
+            timeout=CFG.device_discovery_avahi_timeout,
         )
     except FileNotFoundError:
         logger.warning("avahi-browse not found; using fallback static DEVICE_IPS")
@@ -221,17 +261,17 @@ def refresh_device_ips():
     """Refresh DEVICE_IPS from Avahi; keep static fallback when needed."""
     global DEVICE_IPS
     discovered = {}
-    for attempt in range(DEVICE_DISCOVERY_RETRIES):
+    for attempt in range(CFG.device_discovery_retries):
         discovered = discover_device_ips_from_avahi()
         if discovered:
             break
-        if attempt < DEVICE_DISCOVERY_RETRIES - 1:
+        if attempt < CFG.device_discovery_retries - 1:
             logger.warning(
                 "No Google Cast devices discovered via Avahi; retrying (%s/%s)",
                 attempt + 1,
-                DEVICE_DISCOVERY_RETRIES,
+                CFG.device_discovery_retries,
             )
-            time.sleep(DEVICE_DISCOVERY_RETRY_WAIT)
+            time.sleep(CFG.device_discovery_retry_wait)
 
     if discovered:
         DEVICE_IPS = discovered
@@ -244,13 +284,19 @@ def refresh_device_ips():
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
-logger.info(f"Starting in {ENV} mode on {IP_SERVER}:{PORT_SERVER}, serving MP3s from {MP3_FOLDER}")
+logger.info(f"Starting in {CFG.env} mode on {CFG.ip_server}:{CFG.port}, serving MP3s from {CFG.mp3_folder}")
 # Chromecast globals (populated on startup)
 cast = None
 mc = None
-cast_executor = ThreadPoolExecutor(max_workers=CAST_WORKERS, thread_name_prefix="cast")
+cast_executor = ThreadPoolExecutor(max_workers=CFG.cast_workers, thread_name_prefix="cast")
 cast_lock = threading.Lock()
 active_casts = set()
+# Updated by the active cast's connection listener; False once its socket drops.
+cast_healthy = False
+# One asyncio.Lock per device IP so concurrent /play calls don't stampede reconnects.
+device_play_locks = {}
+# Last executor job per device IP; a timed-out play keeps running until it finishes.
+device_play_jobs = {}
 
 
 class CastPlaybackError(RuntimeError):
@@ -271,8 +317,21 @@ def _disconnect_cast_client(cast_client, timeout=2):
         logger.exception("Failed to disconnect Chromecast client")
 
 
+class _CastConnectionListener(ConnectionStatusListener):
+    """Track whether the active Chromecast socket is still connected."""
+
+    def __init__(self, cast_client):
+        self.cast_client = cast_client
+
+    def new_connection_status(self, status):
+        global cast_healthy
+        with cast_lock:
+            if self.cast_client is cast:
+                cast_healthy = status.status == CONNECTION_STATUS_CONNECTED
+
+
 def _replace_active_cast(cast_client):
-    global cast, mc
+    global cast, mc, cast_healthy
     stale_casts = []
     with cast_lock:
         if cast and cast is not cast_client:
@@ -280,6 +339,7 @@ def _replace_active_cast(cast_client):
             active_casts.discard(cast)
         cast = cast_client
         mc = cast_client.media_controller if cast_client else None
+        cast_healthy = cast_client is not None
         if cast_client:
             active_casts.add(cast_client)
 
@@ -287,8 +347,21 @@ def _replace_active_cast(cast_client):
         _disconnect_cast_client(stale_cast)
 
 
+def _get_reusable_cast(device_ip):
+    """Return the active cast if it targets device_ip and is still connected."""
+    with cast_lock:
+        if (
+            cast
+            and cast_healthy
+            and cast.cast_info.host == device_ip
+            and cast.socket_client.is_connected
+        ):
+            return cast
+    return None
+
+
 def _disconnect_all_casts():
-    global cast, mc
+    global cast, mc, cast_healthy
     with cast_lock:
         casts_to_disconnect = list(active_casts)
         if cast and cast not in active_casts:
@@ -296,6 +369,7 @@ def _disconnect_all_casts():
         active_casts.clear()
         cast = None
         mc = None
+        cast_healthy = False
 
     for cast_client in casts_to_disconnect:
         _disconnect_cast_client(cast_client)
@@ -310,27 +384,29 @@ async def lifespan(app: FastAPI):
     finally:
         _disconnect_all_casts()
         cast_executor.shutdown(wait=False, cancel_futures=True)
+        telemetry = getattr(app, "telemetry", None)
+        if telemetry:
+            await telemetry.close()
 
 async def startup_event(app: FastAPI):
     """Discover Chromecast using CastBrowser at startup."""
-    global cast, mc, MP3_FOLDER
+    global cast, mc, CFG
       
     # Ensure MP3 folder exists (create if possible)
-    if not os.path.isdir(MP3_FOLDER):
+    if not os.path.isdir(CFG.mp3_folder):
         try:
-            os.makedirs(MP3_FOLDER, exist_ok=True)
-            logger.info("Created MP3 folder %s", MP3_FOLDER)
+            os.makedirs(CFG.mp3_folder, exist_ok=True)
+            logger.info("Created MP3 folder %s", CFG.mp3_folder)
         except PermissionError:
             # If we can't create the requested folder (e.g., '/mp3'), fall back to repo-relative mp3
             try:
-                MP3_FOLDER = str(default_mp3)
-                os.makedirs(MP3_FOLDER, exist_ok=True)
-                logger.warning("Permission denied creating requested MP3 folder; using %s instead", MP3_FOLDER)
+                CFG = replace(CFG, mp3_folder=str(default_mp3))
+                os.makedirs(CFG.mp3_folder, exist_ok=True)
+                logger.warning("Permission denied creating requested MP3 folder; using %s instead", CFG.mp3_folder)
             except Exception as e:
-                logger.exception("Failed to create fallback MP3 folder %s: %s", MP3_FOLDER, e)
+                logger.exception("Failed to create fallback MP3 folder %s: %s", CFG.mp3_folder, e)
         except Exception as e:
-            logger.exception("MP3 folder %s missing and could not be created: %s", MP3_FOLDER, e)
-    app.mount(MP3_ROUTE, StaticFiles(directory=MP3_FOLDER), name="mp3")
+            logger.exception("MP3 folder %s missing and could not be created: %s", CFG.mp3_folder, e)
     refresh_device_ips()
 
     # Initialize telemetry
@@ -345,52 +421,118 @@ class PlayRequest(BaseModel):
     track: str
     device: str
     
-def get_mp3_file_names():
+def _scan_audio_files():
+    """Return {track name: (filename, URL-quoted filename)} for audio files in the MP3 folder.
+
+    Extensions are normalized and filenames URL-quoted here, once per scan, so
+    request handlers only do dict lookups. When a track exists with several
+    extensions, .mp3 wins.
+    """
     try:
-        files = [f[:-4] for f in os.listdir(MP3_FOLDER) if os.path.isfile(os.path.join(MP3_FOLDER, f)) and f.lower().endswith('.mp3')]
-        return files
+        tracks = {}
+        # scandir's DirEntry.is_file() reuses the d_type from readdir, avoiding a stat per file.
+        with os.scandir(CFG.mp3_folder) as entries:
+            for e in entries:
+                name, ext = os.path.splitext(e.name)
+                ext = ext.lower()
+                if ext not in AUDIO_CONTENT_TYPES or not e.is_file():
+                    continue
+                if name not in tracks or ext == ".mp3":
+                    tracks[name] = (e.name, quote(e.name))
+        return tracks
     except Exception as e:
-        logger.exception("Failed to list tracks in %s: %s", MP3_FOLDER, e)
-        return []
+        logger.exception("Failed to list tracks in %s: %s", CFG.mp3_folder, e)
+        return {}
 
 
-def _play_on_cast_blocking(device_ip: str, track_url: str, safe_filename: str):
-    """Run pychromecast operations off the event loop with explicit timeouts."""
+# Cached MP3 listing, refreshed only when the folder mtime changes (or the TTL
+# expires, for filesystems with coarse mtime granularity).
+LISTING_CACHE_TTL = 5.0
+_listing_cache = {"folder": None, "mtime": None, "checked_at": 0.0, "files": {}, "json": None}
+
+
+def _get_listing():
+    """Return {track name: (filename, quoted filename)}, rescanning only on change."""
+    try:
+        mtime = os.stat(CFG.mp3_folder).st_mtime_ns
+    except OSError as e:
+        logger.warning("Failed to stat MP3 folder %s: %s", CFG.mp3_folder, e)
+        return {}
+
+    now = time.monotonic()
+    if (
+        _listing_cache["folder"] != CFG.mp3_folder
+        or _listing_cache["mtime"] != mtime
+        or now - _listing_cache["checked_at"] > LISTING_CACHE_TTL
+    ):
+        _listing_cache["files"] = _scan_audio_files()
+        _listing_cache["folder"] = CFG.mp3_folder
+        _listing_cache["mtime"] = mtime
+        _listing_cache["checked_at"] = now
+    return _listing_cache["files"]
+
+
+def _get_listing_json():
+    """Return (etag, body) for /list, re-serializing only when the listing changes."""
+    files = _get_listing()
+    cached = _listing_cache["json"]
+    if cached is None or cached[0] is not files:
+        # Order alphabetically
+        body = json.dumps(
+            {"tracks": sorted(files)}, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        cached = (files, f'W/"{zlib.crc32(body):08x}"', body)
+        _listing_cache["json"] = cached
+    return cached[1], cached[2]
+
+
+def _connect_cast_blocking(device_ip: str):
+    """Open a new Chromecast connection with bounded retries."""
     local_cast = None
-    local_mc = None
     last_error = None
-    for attempt in range(CAST_CONNECT_TRIES):
+    for attempt in range(CFG.cast_connect_tries):
         try:
             local_cast = pychromecast.get_chromecast_from_host(
-                (device_ip, GOOGLE_HOME_PORT, None, None, None),
+                (device_ip, CFG.google_home_port, None, None, None),
                 tries=1,
-                retry_wait=CAST_CONNECT_RETRY_WAIT,
-                timeout=CAST_CONNECT_TIMEOUT,
+                retry_wait=CFG.cast_connect_retry_wait,
+                timeout=CFG.cast_connect_timeout,
             )
-            local_cast.wait(timeout=CAST_WAIT_TIMEOUT)
+            local_cast.wait(timeout=CFG.cast_wait_timeout)
             local_mc = local_cast.media_controller
             logger.info("Connected to Chromecast at %s (%s)", device_ip, local_cast.cast_info)
-            local_mc.block_until_active(timeout=CAST_CONTROLLER_TIMEOUT)
+            local_mc.block_until_active(timeout=CFG.cast_controller_timeout)
             logger.info("Media controller ready for %s", device_ip)
-            break
+            local_cast.socket_client.register_connection_listener(_CastConnectionListener(local_cast))
+            return local_cast
         except Exception as e:
             last_error = e
             _disconnect_cast_client(local_cast)
             local_cast = None
-            if attempt < CAST_CONNECT_TRIES - 1:
+            if attempt < CFG.cast_connect_tries - 1:
                 logger.warning(
                     "Connection to Chromecast at %s failed; retrying (%s/%s): %s",
                     device_ip,
                     attempt + 1,
-                    CAST_CONNECT_TRIES,
+                    CFG.cast_connect_tries,
                     e,
                 )
-                time.sleep(CAST_CONNECT_RETRY_WAIT)
+                time.sleep(CFG.cast_connect_retry_wait)
                 continue
             raise CastPlaybackError(
-                f"Connection failed after {CAST_CONNECT_TRIES} attempts: {last_error}"
+                f"Connection failed after {CFG.cast_connect_tries} attempts: {last_error}"
             ) from e
 
+
+def _play_on_cast_blocking(device_ip: str, track_url: str, safe_filename: str, content_type: str):
+    """Run pychromecast operations off the event loop with explicit timeouts."""
+    local_cast = _get_reusable_cast(device_ip)
+    if local_cast:
+        logger.info("Reusing Chromecast connection to %s", device_ip)
+    else:
+        local_cast = _connect_cast_blocking(device_ip)
+    local_mc = local_cast.media_controller
+
     _replace_active_cast(local_cast)
 
     try:
@@ -401,17 +543,17 @@ def _play_on_cast_blocking(device_ip: str, track_url: str, safe_filename: str):
         logger.warning("Could not stop existing playback (may not be playing anything): %s", e)
 
     logger.info("Waiting to play media %s", track_url)
-    for attempt in range(CAST_PLAY_RETRIES):
+    for attempt in range(CFG.cast_play_retries):
         try:
             logger.info(
                 "Attempting to play media %s (attempt %s/%s)",
                 track_url,
                 attempt + 1,
-                CAST_PLAY_RETRIES,
+                CFG.cast_play_retries,
             )
             local_mc.play_media(
                 track_url,
-                "audio/mp3",
+                content_type,
                 title=f"Playing {safe_filename}",
                 subtitles="From audio Stream Server",
             )
@@ -419,11 +561,11 @@ def _play_on_cast_blocking(device_ip: str, track_url: str, safe_filename: str):
             return
         except pychromecast.error.NotConnected as e:
             logger.warning("Cast not ready, retrying...")
-            if attempt < CAST_PLAY_RETRIES - 1:
-                time.sleep(CAST_PLAY_RETRY_WAIT)
+            if attempt < CFG.cast_play_retries - 1:
+                time.sleep(CFG.cast_play_retry_wait)
                 continue
             raise CastPlaybackError(
-                f"Cast not ready after {CAST_PLAY_RETRIES} retries"
+                f"Cast not ready after {CFG.cast_play_retries} retries"
             ) from e
         except Exception as e:
             raise CastPlaybackError(f"Playback failed: {e}") from e
@@ -432,20 +574,43 @@ def _play_on_cast_blocking(device_ip: str, track_url: str, safe_filename: str):
 async def root():
     return {"status": "ok"}
 
+@app.api_route(MP3_ROUTE + "/{name}", methods=["GET", "HEAD"])
+async def serve_mp3(name: str):
+    """Serve an audio file to the cast device.
+
+    Behind nginx (AB_BEHIND_NGINX), the response only carries an
+    X-Accel-Redirect header and nginx streams the file itself with sendfile.
+    Otherwise FileResponse honors Range requests (206 Partial Content) and
+    uses the server's zero-copy pathsend extension when it is available.
+    """
+    # Only serve files that are listed tracks; this also rules out unknown extensions.
+    track, ext = os.path.splitext(os.path.basename(name))
+    entry = _get_listing().get(track)
+    if not entry or entry[0] != name:
+        raise HTTPException(status_code=404, detail="Not Found")
+    filename, quoted_filename = entry
+    media_type = AUDIO_CONTENT_TYPES[ext.lower()]
+    if CFG.behind_nginx:
+        return Response(
+            media_type=media_type,
+            headers={"X-Accel-Redirect": f"{NGINX_MP3_LOCATION}/{quoted_filename}"},
+        )
+    return FileResponse(os.path.join(CFG.mp3_folder, filename), media_type=media_type)
+
 @app.get("/list")
-def list_tracks():
-    """List available MP3 files in the MP3_FOLDER."""
+def list_tracks(request: Request):
+    """List available audio tracks (.mp3 and .m4a) in the MP3 folder."""
     try:
-        files = get_mp3_file_names()
-        # Order alphabetically
-        files.sort()
-        return {"tracks": files}
+        etag, body = _get_listing_json()
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
     except Exception as e:
-        logger.exception("Failed to list tracks in %s: %s", MP3_FOLDER, e)
+        logger.exception("Failed to list tracks in %s: %s", CFG.mp3_folder, e)
         raise HTTPException(status_code=500, detail="Failed to list tracks")
 
 @app.get("/listdevices")
-def list_tracks():
+def list_devices():
     """List of device available."""
     try:
         refresh_device_ips()
@@ -457,36 +622,35 @@ def list_tracks():
     
 @app.post("/play")
 async def play(req: PlayRequest, request: Request):
-    """Play an MP3 file by filename (track)."""
+    """Play an audio file by filename (track)."""
     track = req.track
     safe_filename = os.path.basename(track)
-    safe_filename_with_ext = safe_filename + ".mp3"
     if not safe_filename:
         raise HTTPException(status_code=400, detail="Invalid track name")
 
-    files = get_mp3_file_names()
-    if safe_filename not in files:
+    # Names come from the cached directory scan, so the lookup also rules out traversal.
+    entry = _get_listing().get(safe_filename)
+    if not entry:
         raise HTTPException(status_code=404, detail="Track not found")
-
-    local_path = os.path.join(MP3_FOLDER, safe_filename_with_ext)
+    filename, quoted_filename = entry
+    local_path = os.path.join(CFG.mp3_folder, filename)
+    content_type = AUDIO_CONTENT_TYPES[os.path.splitext(filename)[1].lower()]
     logger.info(
-        "Requested track: %s, safe filename: %s, local path: %s",
+        "Requested track: %s, filename: %s, local path: %s",
         track,
-        safe_filename_with_ext,
+        filename,
         local_path,
     )
-    if not os.path.isfile(local_path):
-        raise HTTPException(status_code=404, detail="Track not found")
 
     try:
         await asyncio.wait_for(
             asyncio.to_thread(refresh_device_ips),
-            timeout=DEVICE_REFRESH_TIMEOUT,
+            timeout=CFG.device_refresh_timeout,
         )
     except asyncio.TimeoutError:
         logger.warning(
             "Device discovery timed out after %ss; using cached device list",
-            DEVICE_REFRESH_TIMEOUT,
+            CFG.device_refresh_timeout,
         )
 
     device_ip = DEVICE_IPS.get(req.device)
@@ -506,22 +670,29 @@ async def play(req: PlayRequest, request: Request):
         req.device,
         device_ip,
     )
-    track_url = f"http://{IP_SERVER.rstrip('/')}:{PORT_SERVER}{MP3_ROUTE}/{quote(safe_filename_with_ext)}"
+    track_url = f"http://{CFG.ip_server.rstrip('/')}:{CFG.port}{MP3_ROUTE}/{quoted_filename}"
 
-    loop = asyncio.get_running_loop()
     play_job = functools.partial(
         _play_on_cast_blocking,
         device_ip,
         track_url,
         safe_filename,
+        content_type,
     )
+    device_lock = device_play_locks.setdefault(device_ip, asyncio.Lock())
     try:
-        await asyncio.wait_for(
-            loop.run_in_executor(cast_executor, play_job),
-            timeout=CAST_REQUEST_TIMEOUT,
-        )
+        async with device_lock:
+            # Waiting out a previous play counts against this request's timeout.
+            async with asyncio.timeout(CFG.cast_request_timeout):
+                # A play that timed out still owns the device until its thread returns.
+                previous_job = device_play_jobs.get(device_ip)
+                if previous_job is not None and not previous_job.done():
+                    await asyncio.wait([asyncio.wrap_future(previous_job)])
+                job = cast_executor.submit(play_job)
+                device_play_jobs[device_ip] = job
+                await asyncio.wrap_future(job)
     except asyncio.TimeoutError:
-        message = f"Cast operation timed out after {CAST_REQUEST_TIMEOUT:g}s"
+        message = f"Cast operation timed out after {CFG.cast_request_timeout:g}s"
         logger.exception(message)
         try:
             await app.telemetry.record_playback(
@@ -563,5 +734,14 @@ async def play(req: PlayRequest, request: Request):
 
 if __name__ == "__main__":
 
-    # Run in development mode, reload allows hot-reload when you change the code
-    uvicorn.run("main:app", host="0.0.0.0", port=PORT_SERVER, reload=ENV=="development")
+    # Run in development mode, reload allows hot-reload when you change the code.
+    # uvloop and httptools come with uvicorn[standard]; uvloop has no Windows build.
+    # Behind nginx only the local proxy should reach uvicorn, so bind loopback.
+    uvicorn.run(
+        "main:app",
+        host="127.0.0.1" if CFG.behind_nginx else "0.0.0.0",
+        port=CFG.listen_port,
+        reload=CFG.env=="development",
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+    )
@@ -1,17 +1,54 @@
 """Telemetry module for tracking MP3 playback events."""
 import aiosqlite
+import asyncio
+import hashlib
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, Response
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
 # Database path (in repo root)
 DB_PATH = Path(__file__).resolve().parents[2] / "telemetry.db"
+DASHBOARD_TEMPLATE_PATH = Path(__file__).parent / "templates" / "telemetry_dashboard.html"
+
+# Maximum number of queued events inserted per transaction
+WRITE_BATCH_SIZE = 500
+
+
+def _cutoff_date(days: int) -> str:
+    """Return the UTC date `days` ago as an ISO string.
+
+    Comparing the raw timestamp column against this value (instead of wrapping
+    the column in DATE()) lets SQLite use the timestamp index.
+    """
+    return (datetime.now(timezone.utc).date() - timedelta(days=days)).isoformat()
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recent timestamp
+_timestamp_prefix = (None, "")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as a naive ISO-8601 string with milliseconds.
+
+    Rows written before this change used datetime.utcnow().isoformat(), with
+    microseconds (or no fraction when they were zero); new rows carry
+    milliseconds. Both sort correctly as text, but events recorded within the
+    same millisecond now tie. The second-resolution prefix is formatted once
+    per second and reused, so bursts of events only pay for appending the
+    milliseconds.
+    """
+    global _timestamp_prefix
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    if _timestamp_prefix[0] != seconds:
+        _timestamp_prefix = (seconds, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)))
+    return f"{_timestamp_prefix[1]}.{nanos // 1_000_000:03d}"
 
 
 def _device_clause(device: Optional[str]) -> tuple[str, list]:
@@ -84,6 +121,17 @@ class HealthStatus(BaseModel):
     message: str
 
 
+class DashboardBundle(BaseModel):
+    """Model for all dashboard data in a single response."""
+    health: HealthStatus
+    top_tracks: List[TopTrack]
+    daily: List[DailyStats]
+    weekly: List[WeeklyStats]
+    monthly: List[MonthlyStats]
+    heatmap: List[HeatmapStat]
+    evening_heatmap: List[EveningHeatmapStat]
+
+
 class TelemetryService:
     """Service for managing telemetry data."""
 
@@ -95,47 +143,162 @@ class TelemetryService:
         """
         self.db_path = db_path
         self._initialized = False
+        self._db: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
 
     async def initialize(self):
-        """Initialize the database and create schema if needed."""
+        """Open the shared database connection and create schema if needed."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # Create playback_events table
-                await db.execute("""
-                    CREATE TABLE IF NOT EXISTS playback_events (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        track_name TEXT NOT NULL,
-                        device_name TEXT,
-                        device_ip TEXT,
-                        timestamp_utc TEXT NOT NULL,
-                        status TEXT NOT NULL,
-                        error_message TEXT
-                    )
-                """)
-
-                # Create indexes for performance
-                await db.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_timestamp
-                    ON playback_events(timestamp_utc)
-                """)
-
-                await db.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_track_name
-                    ON playback_events(track_name)
-                """)
+            self._db = await aiosqlite.connect(self.db_path)
+            db = self._db
+            await db.execute("PRAGMA journal_mode=WAL")
+            await db.execute("PRAGMA synchronous=NORMAL")
+            await db.execute("PRAGMA temp_store=MEMORY")
+            await db.execute("PRAGMA cache_size=-20000")
+
+            # Create playback_events table
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS playback_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    track_name TEXT NOT NULL,
+                    device_name TEXT,
+                    device_ip TEXT,
+                    timestamp_utc TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    error_message TEXT
+                )
+            """)
+
+            # Create indexes for performance
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_timestamp
+                ON playback_events(timestamp_utc)
+            """)
+
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_status_timestamp
+                ON playback_events(status, timestamp_utc)
+            """)
+
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_track_name
+                ON playback_events(track_name)
+            """)
+
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_device_name
+                ON playback_events(device_name)
+            """)
+
+            # Daily per-track/per-device success counts, maintained by the writer
+            # so the stats endpoints don't re-aggregate the whole event log.
+            async with db.execute("""
+                SELECT 1 FROM sqlite_master
+                WHERE type = 'table' AND name = 'playback_daily_stats'
+            """) as cursor:
+                has_daily_stats = await cursor.fetchone() is not None
+
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS playback_daily_stats (
+                    date TEXT NOT NULL,
+                    track_name TEXT NOT NULL,
+                    device_name TEXT NOT NULL DEFAULT '',
+                    play_count INTEGER NOT NULL,
+                    PRIMARY KEY (date, track_name, device_name)
+                )
+            """)
 
+            if not has_daily_stats:
+                # Backfill from the existing event log the first time the table is created
                 await db.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_device_name
-                    ON playback_events(device_name)
+                    INSERT INTO playback_daily_stats (date, track_name, device_name, play_count)
+                    SELECT DATE(timestamp_utc), track_name, COALESCE(device_name, ''), COUNT(*)
+                    FROM playback_events
+                    WHERE status = 'success'
+                    GROUP BY DATE(timestamp_utc), track_name, COALESCE(device_name, '')
                 """)
 
-                await db.commit()
-                self._initialized = True
-                logger.info(f"Telemetry database initialized at {self.db_path}")
+            await db.commit()
+            self._writer_task = asyncio.create_task(self._write_loop())
+            self._initialized = True
+            logger.info(f"Telemetry database initialized at {self.db_path}")
         except Exception as e:
             logger.error(f"Failed to initialize telemetry database: {e}")
             raise
 
+    async def close(self):
+        """Flush queued events and close the shared database connection."""
+        if self._writer_task is not None:
+            await self._queue.join()
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+            self._initialized = False
+
+    async def _write_loop(self):
+        """Drain the event queue, inserting events in batched transactions."""
+        while True:
+            batch = [await self._queue.get()]
+            while not self._queue.empty() and len(batch) < WRITE_BATCH_SIZE:
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._flush(batch)
+                logger.debug(f"Flushed {len(batch)} playback event(s)")
+            except Exception as e:
+                if len(batch) == 1:
+                    logger.error(f"Failed to record playback event: {e}")
+                else:
+                    # Retry one event at a time so a single bad event doesn't drop the batch
+                    logger.warning(f"Failed to record {len(batch)} playback events, retrying individually: {e}")
+                    for event in batch:
+                        try:
+                            await self._flush([event])
+                        except Exception as e:
+                            logger.error(f"Failed to record playback event: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: List[tuple]):
+        """Insert a batch of playback events and their daily stats in one transaction.
+
+        The event log and playback_daily_stats either both commit or both roll back.
+        """
+        db = self._db
+        async with self._write_lock:
+            await db.execute("BEGIN")
+            try:
+                await db.executemany("""
+                    INSERT INTO playback_events
+                    (track_name, device_name, device_ip, timestamp_utc, status, error_message)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, batch)
+
+                await db.executemany("""
+                    INSERT INTO playback_daily_stats (date, track_name, device_name, play_count)
+                    VALUES (DATE(?), ?, COALESCE(?, ''), 1)
+                    ON CONFLICT (date, track_name, device_name)
+                    DO UPDATE SET play_count = play_count + 1
+                """, [
+                    (timestamp_utc, track_name, device_name)
+                    for track_name, device_name, _, timestamp_utc, status, _ in batch
+                    if status == "success"
+                ])
+
+                await db.commit()
+            except Exception:
+                # Discard the partial batch so a later commit can't persist it
+                await db.rollback()
+                raise
+
     async def record_playback(
         self,
         track_name: str,
@@ -144,7 +307,9 @@ class TelemetryService:
         status: str = "success",
         error_message: Optional[str] = None
     ):
-        """Record a playback event.
+        """Queue a playback event for the background writer.
+
+        Returns immediately; events are committed in batches by the writer task.
 
         Args:
             track_name: Name of the track
@@ -154,17 +319,11 @@ class TelemetryService:
             error_message: Error message if status is failed
         """
         try:
-            timestamp_utc = datetime.utcnow().isoformat()
-
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT INTO playback_events
-                    (track_name, device_name, device_ip, timestamp_utc, status, error_message)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (track_name, device_name, device_ip, timestamp_utc, status, error_message))
-
-                await db.commit()
-                logger.debug(f"Recorded playback event: {track_name} on {device_name} - {status}")
+            timestamp_utc = _utc_timestamp()
+            await self._queue.put(
+                (track_name, device_name, device_ip, timestamp_utc, status, error_message)
+            )
+            logger.debug(f"Queued playback event: {track_name} on {device_name} - {status}")
         except Exception as e:
             logger.error(f"Failed to record playback event: {e}")
             # Don't raise - telemetry failures shouldn't affect playback
@@ -172,15 +331,15 @@ class TelemetryService:
     async def get_known_devices(self) -> List[str]:
         """Get distinct device names that have playback history."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute("""
-                    SELECT DISTINCT device_name
-                    FROM playback_events
-                    WHERE device_name IS NOT NULL
-                    ORDER BY device_name
-                """) as cursor:
-                    rows = await cursor.fetchall()
-                    return [row[0] for row in rows]
+            db = self._db
+            async with db.execute("""
+                SELECT DISTINCT device_name
+                FROM playback_events
+                WHERE device_name IS NOT NULL
+                ORDER BY device_name
+            """) as cursor:
+                rows = await cursor.fetchall()
+                return [row[0] for row in rows]
         except Exception as e:
             logger.error(f"Failed to get known devices: {e}")
             return []
@@ -199,16 +358,27 @@ class TelemetryService:
         """
         try:
             device_sql, device_params = _device_clause(device)
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                async with db.execute(f"""
-                    SELECT * FROM playback_events
-                    WHERE 1=1 {device_sql}
-                    ORDER BY timestamp_utc DESC
-                    LIMIT ?
-                """, (*device_params, limit)) as cursor:
-                    rows = await cursor.fetchall()
-                    return [PlaybackEvent(**dict(row)) for row in rows]
+            db = self._db
+            async with db.execute(f"""
+                SELECT id, track_name, device_name, device_ip, timestamp_utc, status, error_message
+                FROM playback_events
+                WHERE 1=1 {device_sql}
+                ORDER BY timestamp_utc DESC
+                LIMIT ?
+            """, (*device_params, limit)) as cursor:
+                rows = await cursor.fetchall()
+                return [
+                    PlaybackEvent.model_construct(
+                        id=r[0],
+                        track_name=r[1],
+                        device_name=r[2],
+                        device_ip=r[3],
+                        timestamp_utc=r[4],
+                        status=r[5],
+                        error_message=r[6],
+                    )
+                    for r in rows
+                ]
         except Exception as e:
             logger.error(f"Failed to get recent events: {e}")
             return []
@@ -227,22 +397,23 @@ class TelemetryService:
         """
         try:
             device_sql, device_params = _device_clause(device)
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                async with db.execute(f"""
-                    SELECT
-                        DATE(timestamp_utc) as date,
-                        track_name,
-                        COUNT(*) as play_count
-                    FROM playback_events
-                    WHERE status = 'success'
-                    AND DATE(timestamp_utc) >= DATE('now', '-' || ? || ' days')
-                    {device_sql}
-                    GROUP BY DATE(timestamp_utc), track_name
-                    ORDER BY date DESC, play_count DESC
-                """, (limit, *device_params)) as cursor:
-                    rows = await cursor.fetchall()
-                    return [DailyStats(**dict(row)) for row in rows]
+            db = self._db
+            async with db.execute(f"""
+                SELECT
+                    date,
+                    track_name,
+                    SUM(play_count) as play_count
+                FROM playback_daily_stats
+                WHERE date >= ?
+                {device_sql}
+                GROUP BY date, track_name
+                ORDER BY date DESC, play_count DESC
+            """, (_cutoff_date(limit), *device_params)) as cursor:
+                rows = await cursor.fetchall()
+                return [
+                    DailyStats.model_construct(date=r[0], track_name=r[1], play_count=r[2])
+                    for r in rows
+                ]
         except Exception as e:
             logger.error(f"Failed to get daily stats: {e}")
             return []
@@ -262,23 +433,24 @@ class TelemetryService:
         try:
             days = limit * 7
             device_sql, device_params = _device_clause(device)
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                async with db.execute(f"""
-                    SELECT
-                        CAST(STRFTIME('%Y', timestamp_utc) AS INTEGER) as year,
-                        CAST(STRFTIME('%W', timestamp_utc) AS INTEGER) as week,
-                        track_name,
-                        COUNT(*) as play_count
-                    FROM playback_events
-                    WHERE status = 'success'
-                    AND DATE(timestamp_utc) >= DATE('now', '-' || ? || ' days')
-                    {device_sql}
-                    GROUP BY year, week, track_name
-                    ORDER BY year DESC, week DESC, play_count DESC
-                """, (days, *device_params)) as cursor:
-                    rows = await cursor.fetchall()
-                    return [WeeklyStats(**dict(row)) for row in rows]
+            db = self._db
+            async with db.execute(f"""
+                SELECT
+                    CAST(STRFTIME('%Y', date) AS INTEGER) as year,
+                    CAST(STRFTIME('%W', date) AS INTEGER) as week,
+                    track_name,
+                    SUM(play_count) as play_count
+                FROM playback_daily_stats
+                WHERE date >= ?
+                {device_sql}
+                GROUP BY year, week, track_name
+                ORDER BY year DESC, week DESC, play_count DESC
+            """, (_cutoff_date(days), *device_params)) as cursor:
+                rows = await cursor.fetchall()
+                return [
+                    WeeklyStats.model_construct(year=r[0], week=r[1], track_name=r[2], play_count=r[3])
+                    for r in rows
+                ]
         except Exception as e:
             logger.error(f"Failed to get weekly stats: {e}")
             return []
@@ -297,23 +469,24 @@ class TelemetryService:
         """
         try:
             device_sql, device_params = _device_clause(device)
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                async with db.execute(f"""
-                    SELECT
-                        CAST(STRFTIME('%Y', timestamp_utc) AS INTEGER) as year,
-                        CAST(STRFTIME('%m', timestamp_utc) AS INTEGER) as month,
-                        track_name,
-                        COUNT(*) as play_count
-                    FROM playback_events
-                    WHERE status = 'success'
-                    AND DATE(timestamp_utc) >= DATE('now', '-' || ? || ' months')
-                    {device_sql}
-                    GROUP BY year, month, track_name
-                    ORDER BY year DESC, month DESC, play_count DESC
-                """, (limit, *device_params)) as cursor:
-                    rows = await cursor.fetchall()
-                    return [MonthlyStats(**dict(row)) for row in rows]
+            db = self._db
+            async with db.execute(f"""
+                SELECT
+                    CAST(STRFTIME('%Y', date) AS INTEGER) as year,
+                    CAST(STRFTIME('%m', date) AS INTEGER) as month,
+                    track_name,
+                    SUM(play_count) as play_count
+                FROM playback_daily_stats
+                WHERE date >= DATE('now', '-' || ? || ' months')
+                {device_sql}
+                GROUP BY year, month, track_name
+                ORDER BY year DESC, month DESC, play_count DESC
+            """, (limit, *device_params)) as cursor:
+                rows = await cursor.fetchall()
+                return [
+                    MonthlyStats.model_construct(year=r[0], month=r[1], track_name=r[2], play_count=r[3])
+                    for r in rows
+                ]
         except Exception as e:
             logger.error(f"Failed to get monthly stats: {e}")
             return []
@@ -336,42 +509,43 @@ class TelemetryService:
         """
         try:
             device_sql, device_params = _device_clause(device)
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-
-                if days:
-                    query = f"""
-                        SELECT
-                            track_name,
-                            COUNT(*) as play_count,
-                            MAX(timestamp_utc) as last_played
-                        FROM playback_events
-                        WHERE status = 'success'
-                        AND DATE(timestamp_utc) >= DATE('now', '-' || ? || ' days')
-                        {device_sql}
-                        GROUP BY track_name
-                        ORDER BY play_count DESC
-                        LIMIT ?
-                    """
-                    params = (days, *device_params, limit)
-                else:
-                    query = f"""
-                        SELECT
-                            track_name,
-                            COUNT(*) as play_count,
-                            MAX(timestamp_utc) as last_played
-                        FROM playback_events
-                        WHERE status = 'success'
-                        {device_sql}
-                        GROUP BY track_name
-                        ORDER BY play_count DESC
-                        LIMIT ?
-                    """
-                    params = (*device_params, limit)
-
-                async with db.execute(query, params) as cursor:
-                    rows = await cursor.fetchall()
-                    return [TopTrack(**dict(row)) for row in rows]
+            db = self._db
+            if days:
+                query = f"""
+                    SELECT
+                        track_name,
+                        COUNT(*) as play_count,
+                        MAX(timestamp_utc) as last_played
+                    FROM playback_events
+                    WHERE status = 'success'
+                    AND timestamp_utc >= ?
+                    {device_sql}
+                    GROUP BY track_name
+                    ORDER BY play_count DESC
+                    LIMIT ?
+                """
+                params = (_cutoff_date(days), *device_params, limit)
+            else:
+                query = f"""
+                    SELECT
+                        track_name,
+                        COUNT(*) as play_count,
+                        MAX(timestamp_utc) as last_played
+                    FROM playback_events
+                    WHERE status = 'success'
+                    {device_sql}
+                    GROUP BY track_name
+                    ORDER BY play_count DESC
+                    LIMIT ?
+                """
+                params = (*device_params, limit)
+
+            async with db.execute(query, params) as cursor:
+                rows = await cursor.fetchall()
+                return [
+                    TopTrack.model_construct(track_name=r[0], play_count=r[1], last_played=r[2])
+                    for r in rows
+                ]
         except Exception as e:
             logger.error(f"Failed to get top tracks: {e}")
             return []
@@ -390,23 +564,25 @@ class TelemetryService:
         """
         try:
             device_sql, device_params = _device_clause(device)
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                async with db.execute(f"""
-                    SELECT
-                        CAST(STRFTIME('%w', datetime(timestamp_utc, '-8 hours')) AS INTEGER) as day_of_week,
-                        CAST(STRFTIME('%H', datetime(timestamp_utc, '-8 hours')) AS INTEGER) * 4
-                            + CAST(STRFTIME('%M', datetime(timestamp_utc, '-8 hours')) AS INTEGER) / 15 as time_slot,
-                        COUNT(*) as play_count
-                    FROM playback_events
-                    WHERE status = 'success'
-                    AND DATE(timestamp_utc) >= DATE('now', '-' || ? || ' days')
-                    {device_sql}
-                    GROUP BY day_of_week, time_slot
-                    ORDER BY day_of_week, time_slot
-                """, (days, *device_params)) as cursor:
-                    rows = await cursor.fetchall()
-                    return [HeatmapStat(**dict(row)) for row in rows]
+            db = self._db
+            async with db.execute(f"""
+                SELECT
+                    CAST(STRFTIME('%w', datetime(timestamp_utc, '-8 hours')) AS INTEGER) as day_of_week,
+                    CAST(STRFTIME('%H', datetime(timestamp_utc, '-8 hours')) AS INTEGER) * 4
+                        + CAST(STRFTIME('%M', datetime(timestamp_utc, '-8 hours')) AS INTEGER) / 15 as time_slot,
+                    COUNT(*) as play_count
+                FROM playback_events
+                WHERE status = 'success'
+                AND timestamp_utc >= ?
+                {device_sql}
+                GROUP BY day_of_week, time_slot
+                ORDER BY day_of_week, time_slot
+            """, (_cutoff_date(days), *device_params)) as cursor:
+                rows = await cursor.fetchall()
+                return [
+                    HeatmapStat.model_construct(day_of_week=r[0], time_slot=r[1], play_count=r[2])
+                    for r in rows
+                ]
         except Exception as e:
             logger.error(f"Failed to get heatmap stats: {e}")
             return []
@@ -428,26 +604,28 @@ class TelemetryService:
         """
         try:
             device_sql, device_params = _device_clause(device)
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                async with db.execute(f"""
-                    SELECT
-                        DATE(datetime(timestamp_utc, '-8 hours')) as play_date,
-                        CAST(STRFTIME('%H', datetime(timestamp_utc, '-8 hours')) AS INTEGER) * 4
-                            + CAST(STRFTIME('%M', datetime(timestamp_utc, '-8 hours')) AS INTEGER) / 15 - 74 as time_slot,
-                        COUNT(*) as play_count
-                    FROM playback_events
-                    WHERE status = 'success'
-                    AND DATE(timestamp_utc) >= DATE('now', '-' || ? || ' days')
-                    AND CAST(STRFTIME('%H', datetime(timestamp_utc, '-8 hours')) AS INTEGER) * 4
-                        + CAST(STRFTIME('%M', datetime(timestamp_utc, '-8 hours')) AS INTEGER) / 15
-                        BETWEEN 74 AND 88
-                    {device_sql}
-                    GROUP BY play_date, time_slot
-                    ORDER BY play_date, time_slot
-                """, (days, *device_params)) as cursor:
-                    rows = await cursor.fetchall()
-                    return [EveningHeatmapStat(**dict(row)) for row in rows]
+            db = self._db
+            async with db.execute(f"""
+                SELECT
+                    DATE(datetime(timestamp_utc, '-8 hours')) as play_date,
+                    CAST(STRFTIME('%H', datetime(timestamp_utc, '-8 hours')) AS INTEGER) * 4
+                        + CAST(STRFTIME('%M', datetime(timestamp_utc, '-8 hours')) AS INTEGER) / 15 - 74 as time_slot,
+                    COUNT(*) as play_count
+                FROM playback_events
+                WHERE status = 'success'
+                AND timestamp_utc >= ?
+                AND CAST(STRFTIME('%H', datetime(timestamp_utc, '-8 hours')) AS INTEGER) * 4
+                    + CAST(STRFTIME('%M', datetime(timestamp_utc, '-8 hours')) AS INTEGER) / 15
+                    BETWEEN 74 AND 88
+                {device_sql}
+                GROUP BY play_date, time_slot
+                ORDER BY play_date, time_slot
+            """, (_cutoff_date(days), *device_params)) as cursor:
+                rows = await cursor.fetchall()
+                return [
+                    EveningHeatmapStat.model_construct(play_date=r[0], time_slot=r[1], play_count=r[2])
+                    for r in rows
+                ]
         except Exception as e:
             logger.error(f"Failed to get evening heatmap stats: {e}")
             return []
@@ -463,21 +641,21 @@ class TelemetryService:
         """
         try:
             device_sql, device_params = _device_clause(device)
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute(
-                    f"SELECT COUNT(*) as count FROM playback_events WHERE 1=1 {device_sql}",
-                    device_params,
-                ) as cursor:
-                    row = await cursor.fetchone()
-                    total_events = row[0] if row else 0
-
-                scope = f" for {device}" if device else ""
-                return HealthStatus(
-                    status="healthy",
-                    database_connected=True,
-                    total_events=total_events,
-                    message=f"Telemetry system operational with {total_events} events recorded{scope}"
-                )
+            db = self._db
+            async with db.execute(
+                f"SELECT COUNT(*) as count FROM playback_events WHERE 1=1 {device_sql}",
+                device_params,
+            ) as cursor:
+                row = await cursor.fetchone()
+                total_events = row[0] if row else 0
+
+            scope = f" for {device}" if device else ""
+            return HealthStatus(
+                status="healthy",
+                database_connected=True,
+                total_events=total_events,
+                message=f"Telemetry system operational with {total_events} events recorded{scope}"
+            )
         except Exception as e:
             logger.error(f"Health check failed: {e}")
             return HealthStatus(
@@ -487,6 +665,37 @@ class TelemetryService:
                 message=f"Database connection failed: {str(e)}"
             )
 
+    async def get_dashboard_bundle(
+        self, days: int = 30, device: Optional[str] = None
+    ) -> DashboardBundle:
+        """Get everything the dashboard renders in one call.
+
+        Args:
+            days: Number of past days for the period-based sections
+            device: Optional device name filter
+
+        Returns:
+            Combined dashboard data
+        """
+        health, top_tracks, daily, weekly, monthly, heatmap, evening_heatmap = await asyncio.gather(
+            self.get_health_status(device),
+            self.get_top_tracks(10, days, device),
+            self.get_daily_stats(days, device),
+            self.get_weekly_stats(12, device),
+            self.get_monthly_stats(12, device),
+            self.get_heatmap_stats(days, device),
+            self.get_evening_heatmap_stats(days, device),
+        )
+        return DashboardBundle(
+            health=health,
+            top_tracks=top_tracks,
+            daily=daily,
+            weekly=weekly,
+            monthly=monthly,
+            heatmap=heatmap,
+            evening_heatmap=evening_heatmap,
+        )
+
 
 def get_telemetry_router(telemetry: TelemetryService) -> APIRouter:
     """Create and configure the telemetry API router.
@@ -499,6 +708,15 @@ def get_telemetry_router(telemetry: TelemetryService) -> APIRouter:
     """
     router = APIRouter()
 
+    # The dashboard template never changes at runtime: read it once and serve from memory.
+    try:
+        dashboard_html = DASHBOARD_TEMPLATE_PATH.read_text()
+        dashboard_etag = f'"{hashlib.md5(dashboard_html.encode()).hexdigest()}"'
+    except FileNotFoundError:
+        logger.error(f"Dashboard template not found at {DASHBOARD_TEMPLATE_PATH}")
+        dashboard_html = None
+        dashboard_etag = None
+
     @router.get("/devices")
     async def devices():
         """Get device names that have playback history."""
@@ -602,18 +820,27 @@ def get_telemetry_router(telemetry: TelemetryService) -> APIRouter:
         """
         return await telemetry.get_evening_heatmap_stats(days, device)
 
+    @router.get("/stats/dashboard", response_model=DashboardBundle)
+    async def dashboard_stats(
+        days: int = Query(default=30, ge=1, le=365),
+        device: Optional[str] = Query(default=None),
+    ):
+        """Get all dashboard data in a single request.
+
+        Args:
+            days: Number of past days to include (1-365)
+            device: Optional device name filter
+        """
+        return await telemetry.get_dashboard_bundle(days, device)
+
     @router.get("/dashboard", response_class=HTMLResponse)
-    async def dashboard():
+    async def dashboard(request: Request):
         """Serve the telemetry dashboard HTML page."""
-        template_path = Path(__file__).parent / "templates" / "telemetry_dashboard.html"
-        try:
-            with open(template_path, "r") as f:
-                html_content = f.read()
-            return HTMLResponse(content=html_content)
-        except FileNotFoundError:
+        if dashboard_html is None:
             raise HTTPException(status_code=404, detail="Dashboard template not found")
-        except Exception as e:
-            logger.error(f"Failed to load dashboard: {e}")
-            raise HTTPException(status_code=500, detail="Failed to load dashboard")
+        headers = {"ETag": dashboard_etag, "Cache-Control": "public, max-age=300"}
+        if request.headers.get("if-none-match") == dashboard_etag:
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(content=dashboard_html, headers=headers)
 
     return router
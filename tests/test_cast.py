@@ -0,0 +1,70 @@
+"""Run the blocking cast path against autospec'd pychromecast objects.
+
+Autospec makes the mocks reject attributes the real pychromecast classes don't
+have, so an API mismatch fails here instead of turning every /play into a 503.
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+import pychromecast
+from pychromecast.controllers.media import MediaController
+from pychromecast.socket_client import SocketClient
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "audio-stream-google-home"))
+
+import main  # noqa: E402
+
+
+def _make_cast(host):
+    local_cast = mock.create_autospec(pychromecast.Chromecast, instance=True)
+    # Instance attributes set in Chromecast.__init__ aren't visible to autospec.
+    local_cast.socket_client = mock.create_autospec(SocketClient, instance=True)
+    local_cast.socket_client.is_connected = True
+    local_cast.cast_info = mock.Mock(host=host)
+    type(local_cast).media_controller = mock.PropertyMock(
+        return_value=mock.create_autospec(MediaController, instance=True)
+    )
+    return local_cast
+
+
+class PlayOnCastBlockingTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(main.time, "sleep")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(main._disconnect_all_casts)
+
+    def test_connects_and_plays(self):
+        local_cast = _make_cast("192.168.1.10")
+        with mock.patch.object(
+            main.pychromecast, "get_chromecast_from_host", return_value=local_cast
+        ):
+            main._play_on_cast_blocking(
+                "192.168.1.10", "http://server/mp3/Track.m4a", "Track.m4a", "audio/mp4"
+            )
+
+        local_cast.wait.assert_called_once()
+        local_cast.socket_client.register_connection_listener.assert_called_once()
+        local_cast.media_controller.play_media.assert_called_once_with(
+            "http://server/mp3/Track.m4a",
+            "audio/mp4",
+            title="Playing Track.m4a",
+            subtitles="From audio Stream Server",
+        )
+
+    def test_reuses_connected_cast(self):
+        local_cast = _make_cast("192.168.1.10")
+        with mock.patch.object(
+            main.pychromecast, "get_chromecast_from_host", return_value=local_cast
+        ) as get_cast:
+            main._play_on_cast_blocking("192.168.1.10", "http://server/mp3/A.mp3", "A.mp3", "audio/mpeg")
+            main._play_on_cast_blocking("192.168.1.10", "http://server/mp3/B.mp3", "B.mp3", "audio/mpeg")
+
+        get_cast.assert_called_once()
+        self.assertEqual(local_cast.media_controller.play_media.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()